@@ -4,6 +4,12 @@ import inkex
 from lxml import etree
 from math import sin, cos, pi
 
+# optional compiled fast path, built with "python setup.py build_ext --inplace"
+try:
+    from _path_draw import draw_paths_recursively as _fast_draw
+except ImportError:
+    _fast_draw = None
+
 class Path:
     """ Class that defines an svg stroke to be drawn in Inkscape
 
@@ -133,6 +139,8 @@ class Path:
     def draw_paths_recursively(path_tree, group, styles_dict):
         """ Static method, draw list of Path instances recursively
         """
+        if _fast_draw is not None:
+            return _fast_draw(path_tree, group, styles_dict)
         for subpath in path_tree:
             if type(subpath) == list:
                 if len(subpath) == 1:
@@ -329,13 +337,7 @@ class Path:
         """
         points_new = []
 
-        # "temporary" (probably permanent) compatibility hack
-        try:
-            long_ = long
-        except:
-            long_ = int
-            
-        if isinstance(transform, (int, long_, float)):
+        if isinstance(transform, (int, float)):
             for p in self.points:
                 points_new.append((transform * p[0],
                                    transform * p[1]))
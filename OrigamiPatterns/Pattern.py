@@ -1,10 +1,41 @@
 #! /usr/bin/env python3
 
-import os
+import numpy as np
 from abc import abstractmethod
 from lxml import etree
 from Path import Path, inkex
 
+# namespace-qualified attribute names, resolved once at import
+_NS_LABEL = inkex.addNS('label', 'inkscape')
+_NS_TCX = inkex.addNS('transform-center-x', 'inkscape')
+_NS_TCY = inkex.addNS('transform-center-y', 'inkscape')
+_NS_TEXT = inkex.addNS('text', 'svg')
+
+_ZERO_STR = '0'
+
+def _resolve_unittouu(effect):
+    """ Pick the unittouu callable for the running Inkscape version (backwards compatibility)
+    """
+    try:
+        return effect.svg.unittouu # new
+    except AttributeError:
+        pass
+    try:
+        return inkex.unittouu # old
+    except AttributeError:
+        return effect.unittouu # older
+
+# shared placeholder style for crease types that are not drawn, Path skips these before any formatting
+_DISABLED_STYLE = {'draw': False}
+
+# per crease type: (name, short flag, default color, default dash duty cycle, dashed by default, "draw" help text)
+CREASE_SPECS = (('mountain', '-m', 4278190335, 0.5, True, 'Draw mountains?'),
+                ('valley', '-v', 65535, 0.25, True, 'Draw valleys?'),
+                ('edge', '-e', 255, 0.25, False, 'Draw edges?'),
+                ('universal', None, 4278255615, 0.25, False, 'Draw universal creases?'),
+                ('semicrease', None, 4294902015, 0.25, False, 'Draw semicreases?'),
+                ('cut', None, 16711935, 0.25, False, 'Draw cuts?'))
+
 class Pattern(inkex.Effect):
     @abstractmethod
     def generate_path_tree(self):
@@ -22,60 +53,17 @@ class Pattern(inkex.Effect):
         # self.add_argument("", "--accuracy", type=int, default=0, help="command line help")
 
         # --------------------------------------------------------------------------------------------------------------
-        # mountain options
-        self.add_argument('-m', '--mountain_stroke_color', default=4278190335, help='The mountain creases color.')
-        self.add_argument('--mountain_stroke_width', type=float, default=0.1, help='Width of mountain strokes.')
-        self.add_argument('--mountain_dashes_len', type=float, default=1.0, help='Mountain dash + gap length.')
-        self.add_argument('--mountain_dashes_duty', type=float, default=0.5, help='Mountain dash duty cycle.')
-        self.add_argument('--mountain_dashes_bool', type=inkex.Boolean, default=True, help='Dashed strokes?')
-        self.add_argument('--mountain_bool', type=inkex.Boolean, default=True, help='Draw mountains?')
-
-        # --------------------------------------------------------------------------------------------------------------
-        # valley options
-        self.add_argument('-v', '--valley_stroke_color', default=65535, help='The valley creases color.')
-        self.add_argument('--valley_stroke_width', type=float,  default=0.1, help='Width of valley strokes.')
-        self.add_argument('--valley_dashes_len', type=float, default=1.0, help='Valley dash + gap length.')
-        self.add_argument('--valley_dashes_duty', type=float, default=0.25, help='Valley dash duty cycle.')
-        self.add_argument('--valley_dashes_bool', type=inkex.Boolean, default=True, help='Dashed strokes?')
-        self.add_argument('--valley_bool', type=inkex.Boolean, default=True, help='Draw valleys?')
-
-        # --------------------------------------------------------------------------------------------------------------
-        # edge options
-        self.add_argument('-e', '--edge_stroke_color', default=255, help='The mountain creases color.')
-        self.add_argument('--edge_stroke_width', type=float, default=0.1, help='Width of edge strokes.')
-        self.add_argument('--edge_dashes_len', type=float, default=1.0, help='Edge dash + gap length.')
-        self.add_argument('--edge_dashes_duty', type=float, default=0.25, help='Edge dash duty cycle.')
-        self.add_argument('--edge_dashes_bool', type=inkex.Boolean, default=False, help='Dashed strokes?')
-        self.add_argument('--edge_bool', type=inkex.Boolean, default=True, help='Draw edges?')
+        # crease options, same set of six arguments for every crease type
+        for name, flag, color, duty, dashed, draw_help in CREASE_SPECS:
+            color_flags = (f'--{name}_stroke_color',) if flag is None else (flag, f'--{name}_stroke_color')
+            self.add_argument(*color_flags, default=color, help=f'The {name} creases color.')
+            self.add_argument(f'--{name}_stroke_width', type=float, default=0.1, help=f'Width of {name} strokes.')
+            self.add_argument(f'--{name}_dashes_len', type=float, default=1.0, help=f'{name.capitalize()} dash + gap length.')
+            self.add_argument(f'--{name}_dashes_duty', type=float, default=duty, help=f'{name.capitalize()} dash duty cycle.')
+            self.add_argument(f'--{name}_dashes_bool', type=inkex.Boolean, default=dashed, help='Dashed strokes?')
+            self.add_argument(f'--{name}_bool', type=inkex.Boolean, default=True, help=draw_help)
         self.add_argument('--edge_single_path', type=inkex.Boolean, default=True, help='Edges as single path?')
 
-        # --------------------------------------------------------------------------------------------------------------
-        # universal crease options
-        self.add_argument('--universal_stroke_color', default=4278255615, help='The universal creases color.')
-        self.add_argument('--universal_stroke_width', type=float, default=0.1, help='Width of universal strokes.')
-        self.add_argument('--universal_dashes_len', type=float, default=1.0, help='Universal dash + gap length.')
-        self.add_argument('--universal_dashes_duty', type=float, default=0.25, help='Universal dash duty cycle.')
-        self.add_argument('--universal_dashes_bool', type=inkex.Boolean, default=False, help='Dashed strokes?')
-        self.add_argument('--universal_bool', type=inkex.Boolean, default=True, help='Draw universal creases?')
-
-        # --------------------------------------------------------------------------------------------------------------
-        # semicrease options
-        self.add_argument('--semicrease_stroke_color',  default=4294902015, help='The semicrease creases color.')
-        self.add_argument('--semicrease_stroke_width', type=float, default=0.1, help='Width of semicrease strokes.')
-        self.add_argument('--semicrease_dashes_len',  type=float, default=1.0, help='Semicrease dash + gap length.')
-        self.add_argument('--semicrease_dashes_duty', type=float,default=0.25, help='Semicrease dash duty cycle.')
-        self.add_argument('--semicrease_dashes_bool', type=inkex.Boolean, default=False, help='Dashed strokes?')
-        self.add_argument('--semicrease_bool', type=inkex.Boolean,  default=True, help='Draw semicreases?')
-
-        # --------------------------------------------------------------------------------------------------------------
-        # cut options
-        self.add_argument('--cut_stroke_color', default=16711935,  help='The cut creases color.')
-        self.add_argument('--cut_stroke_width', type=float, default=0.1, help='Width of cut strokes.')
-        self.add_argument('--cut_dashes_len', type=float, default=1.0, help='Cut dash + gap length.')
-        self.add_argument('--cut_dashes_duty', type=float, default=0.25, help='Cut dash duty cycle.')
-        self.add_argument('--cut_dashes_bool', type=inkex.Boolean, default=False, help='Dashed strokes?')
-        self.add_argument('--cut_bool', type=inkex.Boolean, default=True, help='Draw cuts?')
-
         # --------------------------------------------------------------------------------------------------------------
         # vertex options
         self.add_argument('--vertex_stroke_color', default=255,  help='Vertices\' color.')
@@ -88,12 +76,15 @@ class Pattern(inkex.Effect):
         self.path_tree = []
         self.edge_points = []
         self.translate = (0, 0)
+        self._unit_factor = None
+        self._unittouu = None
+        self._styles_key = None
 
     def effect(self):
         """ Main function, called when the extension is run.
         """
         # construct dictionary containing styles
-        self.create_styles_dict()
+        styles_dict = self.create_styles_dict()
 
         # get paths for selected origami pattern
         self.generate_path_tree()
@@ -104,29 +95,30 @@ class Pattern(inkex.Effect):
         # page_id = self.options.active_tab # sometimes wrong the very first time
 
         # Translate according to translate attribute
-        g_attribs = {inkex.addNS('label', 'inkscape'): '{} Origami pattern'.format(self.options.pattern),
-                       # inkex.addNS('transform-center-x','inkscape'): str(-bbox_center[0]),
-                       # inkex.addNS('transform-center-y','inkscape'): str(-bbox_center[1]),
-                     inkex.addNS('transform-center-x', 'inkscape'): str(0),
-                     inkex.addNS('transform-center-y', 'inkscape'): str(0),
-                     'transform': 'translate(%s,%s)' % self.translate}
+        tx, ty = self.translate
+        g_attribs = {_NS_LABEL: f'{self.options.pattern} Origami pattern',
+                       # _NS_TCX: str(-bbox_center[0]),
+                       # _NS_TCY: str(-bbox_center[1]),
+                     _NS_TCX: _ZERO_STR,
+                     _NS_TCY: _ZERO_STR,
+                     'transform': f'translate({tx},{ty})'}
 
         # add the group to the document's current layer
-        if type(self.path_tree) == list and len(self.path_tree) != 1:
+        if isinstance(self.path_tree, list) and len(self.path_tree) != 1:
             self.topgroup = etree.SubElement(self.get_layer(), 'g', g_attribs)
         else:
             self.topgroup = self.get_layer()
 
         if len(self.edge_points) == 0:
-            Path.draw_paths_recursively(self.path_tree, self.topgroup, self.styles_dict)
+            Path.draw_paths_recursively(self.path_tree, self.topgroup, styles_dict)
         elif self.options.edge_single_path:
             edges = Path(self.edge_points, 'e', closed=True)
-            Path.draw_paths_recursively(self.path_tree + [edges], self.topgroup, self.styles_dict)
+            Path.draw_paths_recursively(self.path_tree + [edges], self.topgroup, styles_dict)
         else:
             edges = Path.generate_separated_paths(self.edge_points, 'e', closed=True)
-            Path.draw_paths_recursively(self.path_tree + edges, self.topgroup, self.styles_dict)
+            Path.draw_paths_recursively(self.path_tree + edges, self.topgroup, styles_dict)
 
-        # self.draw_paths_recursively(self.path_tree, self.topgroup, self.styles_dict)
+        # self.draw_paths_recursively(self.path_tree, self.topgroup, styles_dict)
 
     # compatibility hack
     def get_layer(self):
@@ -138,95 +130,70 @@ class Pattern(inkex.Effect):
     def create_styles_dict(self):
         """ Get stroke style parameters and use them to create the styles dictionary, used for the Path generation
         """
+        # bind options and unit factor to locals, every parameter is read exactly once
+        opts = self.options
         unit_factor = self.calc_unit_factor()
-        
-        # define colour and stroke width
-        mountain_style = {'draw': self.options.mountain_bool,
-                          'stroke': self.get_color_string(self.options.mountain_stroke_color),
-                          'fill': 'none',
-                          'stroke-width': self.options.mountain_stroke_width*unit_factor}
-
-        valley_style = {'draw': self.options.valley_bool,
-                        'stroke': self.get_color_string(self.options.valley_stroke_color),
-                        'fill': 'none',
-                        'stroke-width': self.options.valley_stroke_width*unit_factor}
-
-        universal_style = {'draw': self.options.universal_bool,
-                           'stroke': self.get_color_string(self.options.universal_stroke_color),
-                           'fill': 'none',
-                           'stroke-width': self.options.universal_stroke_width*unit_factor}
-
-        semicrease_style = {'draw': self.options.semicrease_bool,
-                            'stroke': self.get_color_string(self.options.semicrease_stroke_color),
-                            'fill': 'none',
-                            'stroke-width': self.options.semicrease_stroke_width*unit_factor}
 
-        cut_style = {'draw': self.options.cut_bool,
-                     'stroke': self.get_color_string(self.options.cut_stroke_color),
+        crease_specs = (('m', opts.mountain_bool, opts.mountain_stroke_color, opts.mountain_stroke_width,
+                         opts.mountain_dashes_bool, opts.mountain_dashes_len, opts.mountain_dashes_duty),
+                        ('v', opts.valley_bool, opts.valley_stroke_color, opts.valley_stroke_width,
+                         opts.valley_dashes_bool, opts.valley_dashes_len, opts.valley_dashes_duty),
+                        ('e', opts.edge_bool, opts.edge_stroke_color, opts.edge_stroke_width,
+                         opts.edge_dashes_bool, opts.edge_dashes_len, opts.edge_dashes_duty),
+                        ('u', opts.universal_bool, opts.universal_stroke_color, opts.universal_stroke_width,
+                         opts.universal_dashes_bool, opts.universal_dashes_len, opts.universal_dashes_duty),
+                        ('s', opts.semicrease_bool, opts.semicrease_stroke_color, opts.semicrease_stroke_width,
+                         opts.semicrease_dashes_bool, opts.semicrease_dashes_len, opts.semicrease_dashes_duty),
+                        ('c', opts.cut_bool, opts.cut_stroke_color, opts.cut_stroke_width,
+                         opts.cut_dashes_bool, opts.cut_dashes_len, opts.cut_dashes_duty))
+
+        # re-renders with unchanged style options (e.g. parameter sweeps) reuse the cached dictionary
+        key = (opts.units, crease_specs, opts.vertex_bool, opts.vertex_stroke_color, opts.vertex_stroke_width)
+        if self._styles_key == key:
+            return self.styles_dict
+
+        # dash and gap lengths for all crease types, computed in a single vectorized pass
+        lens = np.array([spec[5] for spec in crease_specs])
+        duties = np.array([spec[6] for spec in crease_specs])
+        dashes = lens*duties*unit_factor
+        gaps = np.abs(dashes - lens*unit_factor)
+
+        # define colour, stroke width and (if selected) dashes for every crease type
+        styles_dict = {}
+        for i, (letter, draw, color, width, dashes_bool, _, _) in enumerate(crease_specs):
+            if not draw:
+                styles_dict[letter] = _DISABLED_STYLE
+                continue
+            style = {'draw': True,
+                     'stroke': self.get_color_string(color),
                      'fill': 'none',
-                     'stroke-width': self.options.cut_stroke_width*unit_factor}
-
-        edge_style = {'draw': self.options.edge_bool,
-                      'stroke': self.get_color_string(self.options.edge_stroke_color),
-                      'fill': 'none',
-                      'stroke-width': self.options.edge_stroke_width*unit_factor}
-
-        vertex_style = {'draw': self.options.vertex_bool,
-                        'stroke': self.get_color_string(self.options.vertex_stroke_color),
-                        'fill': 'none',
-                        'stroke-width': self.options.vertex_stroke_width*unit_factor}
-
-        # check if dashed option selected
-        if self.options.mountain_dashes_bool:
-            dash = self.options.mountain_dashes_len*self.options.mountain_dashes_duty*unit_factor
-            gap = abs(dash - self.options.mountain_dashes_len*unit_factor)
-            mountain_style['stroke-dasharray'] = "{},{}".format(dash, gap)
-        if self.options.valley_dashes_bool:
-            dash = self.options.valley_dashes_len * self.options.valley_dashes_duty*unit_factor
-            gap = abs(dash - self.options.valley_dashes_len*unit_factor)
-            valley_style['stroke-dasharray'] = "{},{}".format(dash, gap)
-        if self.options.edge_dashes_bool:
-            dash = self.options.edge_dashes_len * self.options.edge_dashes_duty*unit_factor
-            gap = abs(dash - self.options.edge_dashes_len*unit_factor)
-            edge_style['stroke-dasharray'] = "{},{}".format(dash, gap)
-        if self.options.universal_dashes_bool:
-            dash = self.options.universal_dashes_len * self.options.universal_dashes_duty*unit_factor
-            gap = abs(dash - self.options.universal_dashes_len*unit_factor)
-            universal_style['stroke-dasharray'] = "{},{}".format(dash, gap)
-        if self.options.semicrease_dashes_bool:
-            dash = self.options.semicrease_dashes_len * self.options.semicrease_dashes_duty*unit_factor
-            gap = abs(dash - self.options.semicrease_dashes_len*unit_factor)
-            semicrease_style['stroke-dasharray'] = "{},{}".format(dash, gap)
-        if self.options.cut_dashes_bool:
-            dash = self.options.cut_dashes_len * self.options.cut_dashes_duty*unit_factor
-            gap = abs(dash - self.options.cut_dashes_len*unit_factor)
-            cut_style['stroke-dasharray'] = "{},{}".format(dash, gap)
+                     'stroke-width': width*unit_factor}
+            if dashes_bool:
+                style['stroke-dasharray'] = f'{dashes[i]},{gaps[i]}'
+            styles_dict[letter] = style
+
+        # vertices have no dash options
+        if opts.vertex_bool:
+            styles_dict['p'] = {'draw': True,
+                                'stroke': self.get_color_string(opts.vertex_stroke_color),
+                                'fill': 'none',
+                                'stroke-width': opts.vertex_stroke_width*unit_factor}
+        else:
+            styles_dict['p'] = _DISABLED_STYLE
 
-        self.styles_dict = {'m': mountain_style,
-                            'v': valley_style,
-                            'u': universal_style,
-                            's': semicrease_style,
-                            'c': cut_style,
-                            'e': edge_style,
-                            'p': vertex_style}
+        self._styles_key = key
+        self.styles_dict = styles_dict
+        return styles_dict
 
     def get_color_string(self, longColor, verbose=False):
         """ Convert the long into a #RRGGBB color value
             - verbose=true pops up value for us in defaults
             conversion back is A + B*256^1 + G*256^2 + R*256^3
         """
-        # compatibility hack, no "long" in Python 3
-        try:
-            longColor = long(longColor)
-            if longColor < 0: longColor = long(longColor) & 0xFFFFFFFF
-            hexColor = hex(longColor)[2:-3]
-        except:
-            longColor = int(longColor)
-            hexColor = hex(longColor)[2:-2]
-            inkex.debug = inkex.utils.debug
-
-        hexColor = '#' + hexColor.rjust(6, '0').upper()
-        if verbose: inkex.debug("longColor = {}, hex = {}".format(longColor,hexColor))
+        # color comes packed as 0xRRGGBBAA, mask negative values and drop the alpha byte
+        longColor = int(longColor) & 0xFFFFFFFF
+        hexColor = '#%06X' % (longColor >> 8)
+        if verbose: inkex.utils.debug("longColor = {}, hex = {}".format(longColor, hexColor))
 
         return hexColor
     
@@ -236,12 +203,12 @@ class Pattern(inkex.Effect):
         line_style = {'font-size': '%dpx' % text_height, 'font-style':'normal', 'font-weight': 'normal',
                      'fill': '#F6921E', 'font-family': 'Bitstream Vera Sans,sans-serif',
                      'text-anchor': 'middle', 'text-align': 'center'}
-        line_attribs = {inkex.addNS('label','inkscape'): 'Annotation',
+        line_attribs = {_NS_LABEL: 'Annotation',
                        'style': str(Inkex.style(line_style)),
                        'x': str(position[0]),
                        'y': str((position[1] + text_height) * 1.2)
                        }
-        line = etree.SubElement(node, inkex.addNS('text','svg'), line_attribs)
+        line = etree.SubElement(node, _NS_TEXT, line_attribs)
         line.text = text
 
            
@@ -253,11 +220,9 @@ class Pattern(inkex.Effect):
         """
         # namedView = self.document.getroot().find(inkex.addNS('namedview', 'sodipodi'))
         # doc_units = self.getUnittouu(str(1.0) + namedView.get(inkex.addNS('document-units', 'inkscape')))
-        # backwards compatibility
-        try:
-            return self.svg.unittouu(str(1.0) + self.options.units)
-        except:
-            try:
-                return inkex.unittouu(str(1.0) + self.options.units)
-            except AttributeError:
-                return self.unittouu(str(1.0) + self.options.units)
\ No newline at end of file
+        # memoized on the instance, the unit option does not change between calls
+        if self._unit_factor is None:
+            if self._unittouu is None:
+                self._unittouu = _resolve_unittouu(self)
+            self._unit_factor = self._unittouu(str(1.0) + self.options.units)
+        return self._unit_factor
\ No newline at end of file
@@ -0,0 +1,49 @@
+# cython: language_level=3
+""" Optional compiled version of Path.draw_paths_recursively
+
+Build with "python setup.py build_ext --inplace" from the repository root.
+Path.py falls back to the pure Python implementation if this extension
+has not been built.
+"""
+
+import inkex
+from lxml import etree
+
+_NS_PATH = inkex.addNS('path', 'svg')
+_NS_CIRCLE = inkex.addNS('circle', 'svg')
+
+
+cpdef draw_paths_recursively(list path_tree, object group, dict styles_dict):
+    """ Draw list of Path instances recursively, see Path.draw_paths_recursively
+    """
+    cdef Py_ssize_t i, n
+    cdef list parts
+    cdef str d
+    for subpath in path_tree:
+        if isinstance(subpath, list):
+            if len(subpath) == 1:
+                subgroup = group
+            else:
+                subgroup = etree.SubElement(group, 'g')
+            draw_paths_recursively(subpath, subgroup, styles_dict)
+        else:
+            style = styles_dict[subpath.style]
+            if style['draw']:
+                if subpath.type == 'linear':
+
+                    points = subpath.points
+                    n = len(points)
+                    parts = ['M{},{} '.format(*points[0])]
+                    for i in range(1, n):
+                        parts.append('L{},{} '.format(*points[i]))
+                    if subpath.closed:
+                        parts.append('L{},{} Z'.format(*points[0]))
+                    d = ''.join(parts)
+
+                    attribs = {'style': str(inkex.Style(style)), 'd': d}
+                    etree.SubElement(group, _NS_PATH, attribs)
+                else:
+                    attribs = {'style': str(inkex.Style(style)),
+                               'cx': str(subpath.points[0][0]), 'cy': str(subpath.points[0][1]),
+                               'r': str(subpath.radius)}
+                    etree.SubElement(group, _NS_CIRCLE, attribs)
@@ -0,0 +1,11 @@
+#! /usr/bin/env python3
+
+# Builds the optional compiled fast path for Path.draw_paths_recursively:
+#     python setup.py build_ext --inplace
+# The extensions work without it, falling back to pure Python.
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(name='Origami_Patterns',
+      ext_modules=cythonize('OrigamiPatterns/_path_draw.pyx'))